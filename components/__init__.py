@@ -1,6 +1,7 @@
 from .header import render_header
 from .sidebar import render_sidebar
 from .footer import render_footer
+from .batter_info import render_batter_info
 from .tables import render_stats_table, render_frequency_table
 from .pitchmap import render_pitchmaps_section
 from .wagon_wheel import render_wagon_wheels_section
\ No newline at end of file
@@ -0,0 +1,48 @@
+import streamlit as st
+from utils.calculations import calculate_basic_stats
+
+_BATTER_INFO_TPL = """
+        <div class="batter-info">
+            <h2>{batter}</h2>
+            <p>Batting Style: <strong>{batting_style}</strong></p>
+            <div class="stats-row">
+                <div class="stat-item">
+                    <span class="stat-label">Runs</span>
+                    <span class="stat-value">{runs:,}</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-label">Balls</span>
+                    <span class="stat-value">{balls:,}</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-label">Average</span>
+                    <span class="stat-value">{avg_display}</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-label">Strike Rate</span>
+                    <span class="stat-value">{sr:.2f}</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-label">Boundary %</span>
+                    <span class="stat-value">{boundary_pct:.2f}%</span>
+                </div>
+                <div class="stat-item">
+                    <span class="stat-label">Dot Ball %</span>
+                    <span class="stat-value">{dot_pct:.2f}%</span>
+                </div>
+            </div>
+        </div>
+    """
+
+def render_batter_info(selected_batter, batter_hand, filtered_df):
+    """Render batter info box with raw stats"""
+    stats = calculate_basic_stats(filtered_df)
+    
+    ctx = dict(
+        stats,
+        batter=selected_batter,
+        batting_style="Right-Handed" if batter_hand == "Right" else "Left-Handed",
+        avg_display=f"{stats['average']:.2f}" if stats['average'] is not None else "-"
+    )
+    
+    st.markdown(_BATTER_INFO_TPL.format_map(ctx), unsafe_allow_html=True)
@@ -1,10 +1,103 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
 import matplotlib.patches as mpatches
-from matplotlib.patches import Wedge
+from matplotlib.patches import Wedge, Circle
+from matplotlib.colors import to_rgba
+from matplotlib.collections import LineCollection
 import math
+import hashlib
+import base64
+from io import BytesIO
+
+# Output resolution for the wagon wheel PNGs
+WHEEL_DPI = 90
+
+
+def _new_polar_figure(figsize):
+    """
+    Create a standalone polar figure.
+    
+    The figure is not registered with pyplot, so it needs no plt.close()
+    and is garbage collected once it has been saved to PNG.
+    """
+    fig = Figure(figsize=figsize)
+    # Fixed margins instead of tight_layout(); size and axes never change
+    fig.subplots_adjust(left=0.05, right=0.95, top=0.92, bottom=0.05)
+    ax = fig.add_subplot(projection='polar')
+    return fig, ax
+
+
+def _figure_to_png(fig):
+    """Render a figure to PNG bytes at WHEEL_DPI."""
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=WHEEL_DPI, bbox_inches='tight')
+    return buf.getvalue()
+
+
+def _show_wheel_png(png):
+    """
+    Display wheel PNG bytes stretched to the column width, as st.pyplot did.
+    Uses an inline <img> so it works on every supported Streamlit version.
+    """
+    encoded = base64.b64encode(png).decode('ascii')
+    st.markdown(
+        f'<img src="data:image/png;base64,{encoded}" style="width: 100%;">',
+        unsafe_allow_html=True
+    )
+
+
+def _fingerprint(*arrays):
+    """Cheap content hash of the wheel input arrays, used as a cache key."""
+    h = hashlib.blake2b(digest_size=8)
+    for arr in arrays:
+        if arr is None:
+            h.update(b'none')
+            continue
+        arr = np.ascontiguousarray(arr)
+        if arr.dtype == object:
+            arr = arr.astype(str)
+        h.update(f"{arr.dtype}{arr.shape}".encode())
+        h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def _draw_boundary_circle(ax, facecolor, alpha, r_max):
+    """
+    Draw the boundary (r = 1) as a single filled Circle patch.
+    
+    The patch lives in axes coordinates, where the polar plot spans a circle
+    of radius 0.5 centred on (0.5, 0.5) that reaches r_max (the y-limit).
+    """
+    ax.add_patch(Circle(
+        (0.5, 0.5),
+        0.5 / r_max,
+        transform=ax.transAxes,
+        facecolor=to_rgba(facecolor, alpha),
+        edgecolor='k',
+        linewidth=2
+    ))
+
+
+def adjusted_angles(shot_angles):
+    """
+    Vectorized matplotlib polar angles (degrees) for an array of shot angles.
+    Used for Boundaries and Caught Out wheels.
+    """
+    return np.mod(90.0 - np.asarray(shot_angles, dtype=np.float64), 360.0)
+
+
+def scoring_display_angles(shot_angles, is_rhb):
+    """
+    Vectorized display angles (degrees) for the Scoring Areas wheel.
+    LHB positions are shifted 90° anti-clockwise, as in get_scoring_area_display_angle.
+    """
+    base = adjusted_angles(shot_angles)
+    return base if is_rhb else np.mod(base + 90.0, 360.0)
+
 
 def get_adjusted_angle(shot_angle, is_rhb):
     """
@@ -17,8 +110,7 @@ def get_adjusted_angle(shot_angle, is_rhb):
     if shot_angle is None or pd.isna(shot_angle):
         return None
     
-    matplotlib_angle = (90 - shot_angle) % 360
-    return matplotlib_angle
+    return float(adjusted_angles(shot_angle))
 
 
 def get_scoring_area_display_angle(shot_angle, is_rhb):
@@ -31,46 +123,50 @@ def get_scoring_area_display_angle(shot_angle, is_rhb):
     if shot_angle is None or pd.isna(shot_angle):
         return None
     
-    base_angle = (90 - shot_angle) % 360
-    
-    if not is_rhb:
-        # For LHB, shift 90° anti-clockwise (add 90° to matplotlib angle)
-        base_angle = (base_angle + 90) % 360
-    
-    return base_angle
+    return float(scoring_display_angles(shot_angle, is_rhb))
 
 
-def render_boundaries_wheel(df, is_rhb):
+def _radial_lines(angles_rad, radii, color, linewidth, alpha):
+    """
+    Build a single LineCollection of lines from the centre out to the given radii.
+    """
+    starts = np.stack([angles_rad, np.zeros_like(angles_rad)], axis=1)
+    ends = np.stack([angles_rad, radii], axis=1)
+    segments = np.stack([starts, ends], axis=1)
+    return LineCollection(segments, colors=color, linewidths=linewidth, alpha=alpha)
+
+
+def _boundary_lines(shot_angles, color, linewidth, alpha):
+    """
+    Build a single LineCollection of centre-to-boundary lines, one per shot.
+    """
+    angles_rad = np.deg2rad(adjusted_angles(shot_angles))
+    return _radial_lines(angles_rad, np.ones_like(angles_rad), color, linewidth, alpha)
+
+
+def render_boundaries_wheel(angles, runs, is_rhb):
     """
     Render the Boundaries wagon wheel.
     Shows 4s and 6s as lines from center to boundary.
+    Returns None when there are no boundaries to draw.
     """
-    fig, ax = plt.subplots(figsize=(6, 6), subplot_kw={'projection': 'polar'})
-    
     # Filter for boundaries
-    fours_df = df[df['runs_scored'] == 4].copy()
-    sixes_df = df[df['runs_scored'] == 6].copy()
+    four_angles = angles[runs == 4]
+    six_angles = angles[runs == 6]
+    
+    if len(four_angles) + len(six_angles) == 0:
+        return None
+    
+    fig, ax = _new_polar_figure((6, 6))
     
     # Draw the boundary circle
-    theta = np.linspace(0, 2*np.pi, 100)
-    ax.plot(theta, [1]*100, 'k-', linewidth=2)
-    ax.fill(theta, [1]*100, color='#e8f5e9', alpha=0.3)
+    _draw_boundary_circle(ax, '#e8f5e9', alpha=0.3, r_max=1.1)
     
     # Draw 4s (blue lines)
-    for _, row in fours_df.iterrows():
-        if pd.notna(row.get('shot_angle')):
-            angle_deg = get_adjusted_angle(row['shot_angle'], is_rhb)
-            if angle_deg is not None:
-                angle_rad = np.deg2rad(angle_deg)
-                ax.plot([angle_rad, angle_rad], [0, 1], color='#2196F3', linewidth=1.5, alpha=0.7)
+    ax.add_collection(_boundary_lines(four_angles, color='#2196F3', linewidth=1.5, alpha=0.7))
     
     # Draw 6s (red lines)
-    for _, row in sixes_df.iterrows():
-        if pd.notna(row.get('shot_angle')):
-            angle_deg = get_adjusted_angle(row['shot_angle'], is_rhb)
-            if angle_deg is not None:
-                angle_rad = np.deg2rad(angle_deg)
-                ax.plot([angle_rad, angle_rad], [0, 1], color='#f44336', linewidth=2, alpha=0.8)
+    ax.add_collection(_boundary_lines(six_angles, color='#f44336', linewidth=2, alpha=0.8))
     
     # Clean up the plot
     ax.set_ylim(0, 1.1)
@@ -80,47 +176,41 @@ def render_boundaries_wheel(df, is_rhb):
     ax.set_facecolor('white')
     
     # Add legend
-    four_patch = mpatches.Patch(color='#2196F3', label=f'4s ({len(fours_df)})')
-    six_patch = mpatches.Patch(color='#f44336', label=f'6s ({len(sixes_df)})')
+    four_patch = mpatches.Patch(color='#2196F3', label=f'4s ({len(four_angles)})')
+    six_patch = mpatches.Patch(color='#f44336', label=f'6s ({len(six_angles)})')
     ax.legend(handles=[four_patch, six_patch], loc='upper right', bbox_to_anchor=(1.15, 1.1), fontsize=9)
     
-    plt.tight_layout()
     return fig
 
 
-def render_caught_out_wheel(df, is_rhb):
+def render_caught_out_wheel(angles, magnitudes, dismissal_types, is_rhb):
     """
     Render the Caught Out dismissals wagon wheel.
     Shows caught dismissals with distance (shot_magnitude) and direction (shot_angle).
+    magnitudes may be None when shot_magnitude is not available.
+    Returns None when there are no caught dismissals.
     """
-    fig, ax = plt.subplots(figsize=(6, 6), subplot_kw={'projection': 'polar'})
-    
     # Filter for caught out dismissals
-    caught_df = df[df['dismissalType'].isin(['Caught', 'CaughtSub', 'Caught Out'])].copy()
+    is_caught = np.isin(dismissal_types, ['Caught', 'CaughtSub', 'Caught Out'])
+    caught_count = int(is_caught.sum())
+    
+    if caught_count == 0:
+        return None
+    
+    fig, ax = _new_polar_figure((6, 6))
     
     # Draw the boundary circle
-    theta = np.linspace(0, 2*np.pi, 100)
-    ax.plot(theta, [1]*100, 'k-', linewidth=2)
-    ax.fill(theta, [1]*100, color='#ffebee', alpha=0.3)
+    _draw_boundary_circle(ax, '#ffebee', alpha=0.3, r_max=1.1)
     
     # Normalize shot_magnitude: 167+ maps to boundary (1.0)
-    max_magnitude = 167
+    max_magnitude = 167.0
     
     # Draw caught out lines
-    for _, row in caught_df.iterrows():
-        if pd.notna(row.get('shot_angle')) and pd.notna(row.get('shot_magnitude')):
-            angle_deg = get_adjusted_angle(row['shot_angle'], is_rhb)
-            if angle_deg is not None:
-                angle_rad = np.deg2rad(angle_deg)
-                
-                # Normalize magnitude
-                magnitude = row['shot_magnitude']
-                if magnitude >= max_magnitude:
-                    normalized_mag = 1.0
-                else:
-                    normalized_mag = magnitude / max_magnitude
-                
-                ax.plot([angle_rad, angle_rad], [0, normalized_mag], color='#d32f2f', linewidth=1.5, alpha=0.7)
+    if magnitudes is not None:
+        has_line = is_caught & ~np.isnan(magnitudes)
+        angles_rad = np.deg2rad(adjusted_angles(angles[has_line]))
+        normalized_mag = np.minimum(magnitudes[has_line] / max_magnitude, 1.0)
+        ax.add_collection(_radial_lines(angles_rad, normalized_mag, color='#d32f2f', linewidth=1.5, alpha=0.7))
     
     # Clean up the plot
     ax.set_ylim(0, 1.1)
@@ -130,13 +220,12 @@ def render_caught_out_wheel(df, is_rhb):
     ax.set_facecolor('white')
     
     # Add count label
-    ax.set_title(f'Total: {len(caught_df)} dismissals', fontsize=10, pad=10)
+    ax.set_title(f'Total: {caught_count} dismissals', fontsize=10, pad=10)
     
-    plt.tight_layout()
     return fig
 
 
-def render_scoring_areas_wheel(df, is_rhb):
+def render_scoring_areas_wheel(angles, runs_scored, out_mask, is_rhb):
     """
     Render the Scoring Areas wagon wheel.
     Divides the ground into 8 equal sectors and shows stats in each.
@@ -144,12 +233,10 @@ def render_scoring_areas_wheel(df, is_rhb):
     
     For LHB, display positions are shifted 90° to correctly align with field positions.
     """
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw={'projection': 'polar'})
+    fig, ax = _new_polar_figure((8, 8))
     
     # Draw boundary circle
-    theta = np.linspace(0, 2*np.pi, 100)
-    ax.plot(theta, [1]*100, 'k-', linewidth=2)
-    ax.fill(theta, [1]*100, color='#e3f2fd', alpha=0.2)
+    _draw_boundary_circle(ax, '#e3f2fd', alpha=0.2, r_max=1.15)
     
     # Define 8 sectors (each 45 degrees in cricket angles)
     # Sectors divided at 0, 45, 90, 135, 180, 225, 270, 315 as per PDF
@@ -165,74 +252,56 @@ def render_scoring_areas_wheel(df, is_rhb):
     ]
     
     # Calculate total runs for % of runs calculation
-    total_runs_all = df['runs_scored'].sum() if 'runs_scored' in df.columns else 0
-    
-    # Process each sector
-    for i, (start_angle, end_angle) in enumerate(sector_ranges):
-        # Filter balls in this sector
-        if end_angle == 360:
-            # Last sector: >= 315 and <= 360
-            sector_df = df[
-                (df['shot_angle'] >= start_angle) & (df['shot_angle'] <= 360)
-            ].copy()
-        else:
-            sector_df = df[
-                (df['shot_angle'] >= start_angle) & (df['shot_angle'] < end_angle)
-            ].copy()
-        
+    runs_scored = np.nan_to_num(runs_scored.astype(np.float64))
+    total_runs_all = runs_scored.sum()
+    
+    # Bucket every ball into its sector in a single pass.
+    # Last sector is >= 315 and <= 360, so fold 360 into it before cutting.
+    n_sectors = len(sector_ranges)
+    sector_bins = [start for start, _ in sector_ranges] + [360]
+    cut_angles = np.where(angles == 360, 359.0, angles)
+    sector = pd.cut(cut_angles, bins=sector_bins, right=False, include_lowest=True, labels=False)
+    in_sector = ~np.isnan(sector)
+    sector = sector[in_sector].astype(int)
+    sector_balls = np.bincount(sector, minlength=n_sectors)
+    sector_runs = np.bincount(sector, weights=runs_scored[in_sector], minlength=n_sectors)
+    sector_outs = np.bincount(sector, weights=out_mask[in_sector], minlength=n_sectors)
+    
+    # Draw the 8 unique sector boundaries (360 coincides with 0) in one collection
+    starts = np.array([start for start, _ in sector_ranges], dtype=np.float64)
+    ends = np.array([end for _, end in sector_ranges], dtype=np.float64)
+    spoke_rads = np.deg2rad(scoring_display_angles(starts, is_rhb))
+    ax.add_collection(_radial_lines(spoke_rads, np.ones_like(spoke_rads), color='#666', linewidth=1, alpha=0.8))
+    
+    # Text positions (middle of each sector) using scoring area display angles
+    mid_rads = np.deg2rad(scoring_display_angles((starts + ends) / 2, is_rhb))
+    
+    # Build the stats label for each sector
+    text_r = 0.55  # Position text at 55% of radius
+    labels = []
+    for i in range(len(sector_ranges)):
         # Calculate stats
-        balls = len(sector_df)
-        runs = int(sector_df['runs_scored'].sum()) if balls > 0 else 0
-        
-        # Calculate outs
-        outs = 0
-        if balls > 0:
-            if 'is_out' in sector_df.columns:
-                outs = int(sector_df['is_out'].sum())
-            elif 'dismissalType' in sector_df.columns:
-                outs = int(sector_df['dismissalType'].notna().sum() - (sector_df['dismissalType'] == '').sum())
+        balls = int(sector_balls[i])
+        runs = int(sector_runs[i])
+        outs = int(sector_outs[i])
         
         average = runs / outs if outs > 0 else None
         sr = (runs / balls * 100) if balls > 0 else 0
         pct_runs = (runs / total_runs_all * 100) if total_runs_all > 0 else 0
         
-        # Calculate sector center angle in cricket coordinates
-        mid_angle = (start_angle + end_angle) / 2
+        # Format stats text
+        avg_str = f"{average:.2f}" if average is not None else "-"
+        sr_str = f"{sr:.2f}"
+        pct_str = f"{pct_runs:.1f}"
         
-        # Draw sector boundaries using the scoring area display function
-        for angle in [start_angle, end_angle]:
-            # Handle 360 as 0
-            draw_angle = angle if angle < 360 else 0
-            adj_angle = get_scoring_area_display_angle(draw_angle, is_rhb)
-            if adj_angle is not None:
-                angle_rad = np.deg2rad(adj_angle)
-                ax.plot([angle_rad, angle_rad], [0, 1], color='#666', linewidth=1, alpha=0.8)
-        
-        # Calculate text position (middle of sector) using scoring area display function
-        adj_mid_angle = get_scoring_area_display_angle(mid_angle, is_rhb)
-        if adj_mid_angle is not None:
-            text_angle_rad = np.deg2rad(adj_mid_angle)
-            text_r = 0.55  # Position text at 55% of radius
-            
-            # Format stats text
-            avg_str = f"{average:.2f}" if average is not None else "-"
-            sr_str = f"{sr:.2f}"
-            pct_str = f"{pct_runs:.1f}"
-            
-            # Multi-line text for sector stats
-            stats_text = f"{balls} balls\n{runs} runs\nAvg {avg_str}\nSR {sr_str}\n{pct_str}% of runs"
-            
-            # Add text with font size 10
-            ax.annotate(
-                stats_text,
-                xy=(text_angle_rad, text_r),
-                ha='center',
-                va='center',
-                fontsize=10,
-                fontweight='normal',
-                color='#333',
-                linespacing=1.2
-            )
+        # Multi-line text for sector stats
+        stats_text = f"{balls} balls\n{runs} runs\nAvg {avg_str}\nSR {sr_str}\n{pct_str}% of runs"
+        labels.append((mid_rads[i], text_r, stats_text))
+    
+    # Place all labels with one shared style (font size 10)
+    text_style = dict(ha='center', va='center', fontsize=10, fontweight='normal', color='#333', linespacing=1.2)
+    for text_angle_rad, r, stats_text in labels:
+        ax.text(text_angle_rad, r, stats_text, **text_style)
     
     # Clean up the plot
     ax.set_ylim(0, 1.15)
@@ -241,10 +310,29 @@ def render_scoring_areas_wheel(df, is_rhb):
     ax.spines['polar'].set_visible(False)
     ax.set_facecolor('white')
     
-    plt.tight_layout()
     return fig
 
 
+@st.cache_data(max_entries=32)
+def _cached_boundaries_wheel(fingerprint, is_rhb, _angles, _runs):
+    """Boundaries wheel as PNG bytes (None if empty), keyed by the input data fingerprint."""
+    fig = render_boundaries_wheel(_angles, _runs, is_rhb)
+    return _figure_to_png(fig) if fig is not None else None
+
+
+@st.cache_data(max_entries=32)
+def _cached_caught_out_wheel(fingerprint, is_rhb, _angles, _magnitudes, _dismissal_types):
+    """Caught Out wheel as PNG bytes (None if empty), keyed by the input data fingerprint."""
+    fig = render_caught_out_wheel(_angles, _magnitudes, _dismissal_types, is_rhb)
+    return _figure_to_png(fig) if fig is not None else None
+
+
+@st.cache_data(max_entries=32)
+def _cached_scoring_areas_wheel(fingerprint, is_rhb, _angles, _runs_scored, _out_mask):
+    """Scoring Areas wheel as PNG bytes, keyed by the input data fingerprint."""
+    return _figure_to_png(render_scoring_areas_wheel(_angles, _runs_scored, _out_mask, is_rhb))
+
+
 def render_wagon_wheels_section(df, is_rhb):
     """
     Render all three wagon wheels in the specified layout.
@@ -260,26 +348,45 @@ def render_wagon_wheels_section(df, is_rhb):
         return
     
     # Filter out rows with missing shot_angle
-    valid_df = df[df['shot_angle'].notna()].copy()
+    valid_df = df[df['shot_angle'].notna()]
     
     if len(valid_df) == 0:
         st.warning("No valid shot angle data for visualization.")
         return
     
+    # Pull the columns the wheels need into contiguous arrays once
+    angles = valid_df['shot_angle'].to_numpy(dtype=np.float64)
+    runs = valid_df['runs_scored'].to_numpy()
+    if 'shot_magnitude' in valid_df.columns:
+        magnitudes = valid_df['shot_magnitude'].to_numpy(dtype=np.float64)
+    else:
+        magnitudes = None
+    dismissal_types = valid_df['dismissalType'].to_numpy()
+    if 'is_out' in valid_df.columns:
+        out_mask = valid_df['is_out'].astype(bool).to_numpy()
+    else:
+        out_mask = (valid_df['dismissalType'].notna() & valid_df['dismissalType'].ne('')).to_numpy()
+    
     # First row: Boundaries and Caught Out wheels side by side
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### Boundaries")
-        boundaries_fig = render_boundaries_wheel(valid_df, is_rhb)
-        st.pyplot(boundaries_fig)
-        plt.close(boundaries_fig)
+        boundaries_png = _cached_boundaries_wheel(_fingerprint(angles, runs), is_rhb, angles, runs)
+        if boundaries_png is None:
+            st.caption("No boundaries in filter")
+        else:
+            _show_wheel_png(boundaries_png)
     
     with col2:
         st.markdown("#### Caught Out Dismissals")
-        caught_fig = render_caught_out_wheel(valid_df, is_rhb)
-        st.pyplot(caught_fig)
-        plt.close(caught_fig)
+        caught_png = _cached_caught_out_wheel(
+            _fingerprint(angles, magnitudes, dismissal_types), is_rhb, angles, magnitudes, dismissal_types
+        )
+        if caught_png is None:
+            st.caption("No caught dismissals in filter")
+        else:
+            _show_wheel_png(caught_png)
     
     # Second row: Scoring Areas wheel (larger, centered)
     st.markdown("---")
@@ -289,6 +396,7 @@ def render_wagon_wheels_section(df, is_rhb):
     col_left, col_center, col_right = st.columns([1, 2, 1])
     
     with col_center:
-        scoring_fig = render_scoring_areas_wheel(valid_df, is_rhb)
-        st.pyplot(scoring_fig)
-        plt.close(scoring_fig)
\ No newline at end of file
+        scoring_png = _cached_scoring_areas_wheel(
+            _fingerprint(angles, runs, out_mask), is_rhb, angles, runs, out_mask
+        )
+        _show_wheel_png(scoring_png)
\ No newline at end of file
@@ -2,49 +2,11 @@ import streamlit as st
 import pandas as pd
 from components.sidebar import render_sidebar
 from components.footer import render_footer
+from components.batter_info import render_batter_info
 from components.tables import render_frequency_table
 from utils.filters import apply_filters
 from utils.data_loader import get_batter_hand, get_matches_for_batter_and_filters
-from utils.calculations import calculate_dismissal_by_group, calculate_basic_stats
-
-def render_batter_info(selected_batter, batter_hand, filtered_df):
-    """Render batter info box with raw stats"""
-    stats = calculate_basic_stats(filtered_df)
-    
-    avg_display = f"{stats['average']:.2f}" if stats['average'] is not None else "-"
-    
-    st.markdown(f"""
-        <div class="batter-info">
-            <h2>{selected_batter}</h2>
-            <p>Batting Style: <strong>{"Right-Handed" if batter_hand == "Right" else "Left-Handed"}</strong></p>
-            <div class="stats-row">
-                <div class="stat-item">
-                    <span class="stat-label">Runs</span>
-                    <span class="stat-value">{stats['runs']:,}</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Balls</span>
-                    <span class="stat-value">{stats['balls']:,}</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Average</span>
-                    <span class="stat-value">{avg_display}</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Strike Rate</span>
-                    <span class="stat-value">{stats['sr']:.2f}</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Boundary %</span>
-                    <span class="stat-value">{stats['boundary_pct']:.2f}%</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Dot Ball %</span>
-                    <span class="stat-value">{stats['dot_pct']:.2f}%</span>
-                </div>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+from utils.calculations import calculate_dismissal_by_group
 
 def render_dismissals_page(df):
     """Render the Dismissals analysis page"""
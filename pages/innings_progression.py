@@ -1,90 +1,71 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from components.sidebar import render_sidebar
 from components.footer import render_footer
+from components.batter_info import render_batter_info
 from components.tables import render_stats_table
 from utils.filters import apply_filters
-from utils.data_loader import get_batter_hand, get_matches_for_batter_and_filters
+from utils.data_loader import get_batter_hand, get_matches_for_batter_and_filters, get_matches_df
 from utils.calculations import (
     calculate_progression_data,
-    calculate_stats_by_group,
-    calculate_basic_stats
+    calculate_stats_by_group
 )
 
-def render_batter_info(selected_batter, batter_hand, filtered_df):
-    """Render batter info box with raw stats"""
-    stats = calculate_basic_stats(filtered_df)
-    
-    avg_display = f"{stats['average']:.2f}" if stats['average'] is not None else "-"
-    
-    st.markdown(f"""
-        <div class="batter-info">
-            <h2>{selected_batter}</h2>
-            <p>Batting Style: <strong>{"Right-Handed" if batter_hand == "Right" else "Left-Handed"}</strong></p>
-            <div class="stats-row">
-                <div class="stat-item">
-                    <span class="stat-label">Runs</span>
-                    <span class="stat-value">{stats['runs']:,}</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Balls</span>
-                    <span class="stat-value">{stats['balls']:,}</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Average</span>
-                    <span class="stat-value">{avg_display}</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Strike Rate</span>
-                    <span class="stat-value">{stats['sr']:.2f}</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Boundary %</span>
-                    <span class="stat-value">{stats['boundary_pct']:.2f}%</span>
-                </div>
-                <div class="stat-item">
-                    <span class="stat-label">Dot Ball %</span>
-                    <span class="stat-value">{stats['dot_pct']:.2f}%</span>
-                </div>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+# (column, subplot title, y-axis label, line colour) for each progression plot, row-major
+PROGRESSION_PLOTS = [
+    ('SR', 'Strike Rate per Rolling Window', 'Strike Rate Progression', "#4ade80"),
+    ('Boundary %', 'Boundary % per Rolling Window', 'Boundary % Progression', "#60a5fa"),
+    ('Dot %', 'Dot Balls % per Rolling Window', 'Dot Balls % Progression', "#f87171"),
+    ('Aerial %', 'Aerial Shots % per Rolling Window', 'Aerial Shots % Progression', "#fbbf24"),
+]
 
-def create_progression_plot(data, y_column, title, y_label, color="#4ade80"):
-    """Create a line plot for progression data"""
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=data['Ball'],
-        y=data[y_column],
-        mode='lines+markers',
-        name=y_label,
-        line=dict(color=color, width=2),
-        marker=dict(size=6),
-        hovertemplate=f"Ball %{{x}}<br>{y_label}: %{{y:.2f}}<extra></extra>"
-    ))
-    
-    # Update layout with simpler syntax for plotly compatibility
-    fig.update_layout(
-        title_text=title,
+def create_progression_plot(data, plots=PROGRESSION_PLOTS):
+    """Create a 2x2 grid of line plots for progression data in a single figure"""
+    fig = make_subplots(
+        rows=2,
+        cols=2,
+        subplot_titles=[title for _, title, _, _ in plots],
+        vertical_spacing=0.2,
+        horizontal_spacing=0.1
+    )
+    
+    for i, (y_column, _, y_label, color) in enumerate(plots):
+        row, col = divmod(i, 2)
+        fig.add_trace(go.Scattergl(
+            x=data['Ball'],
+            y=data[y_column],
+            mode='lines+markers',
+            name=y_label,
+            line=dict(color=color, width=2),
+            marker=dict(size=6),
+            hovertemplate=f"Ball %{{x}}<br>{y_label}: %{{y:.2f}}<extra></extra>"
+        ), row=row + 1, col=col + 1)
+        fig.update_yaxes(title_text=y_label, row=row + 1, col=col + 1)
+    
+    fig.update_xaxes(
+        title_text="Rolling window for Balls faced",
         title_font_color="white",
-        title_font_size=14,
-        title_x=0.5,
-        xaxis_title="Rolling window for Balls faced",
-        xaxis_title_font_color="white",
-        xaxis_tickfont_color="white",
-        xaxis_gridcolor='rgba(255,255,255,0.1)',
-        xaxis_showgrid=True,
-        yaxis_title=y_label,
-        yaxis_title_font_color="white",
-        yaxis_tickfont_color="white",
-        yaxis_gridcolor='rgba(255,255,255,0.1)',
-        yaxis_showgrid=True,
+        tickfont_color="white",
+        gridcolor='rgba(255,255,255,0.1)',
+        showgrid=True
+    )
+    fig.update_yaxes(
+        title_font_color="white",
+        tickfont_color="white",
+        gridcolor='rgba(255,255,255,0.1)',
+        showgrid=True
+    )
+    
+    # Subplot titles are layout annotations
+    fig.update_annotations(font_color="white", font_size=14)
+    
+    fig.update_layout(
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
         margin=dict(l=50, r=20, t=50, b=50),
-        height=300,
+        height=650,
         showlegend=False
     )
     
@@ -110,8 +91,9 @@ def render_innings_progression_page(df):
         render_footer()
         return
     
-    # Get match IDs for average metrics calculation
+    # Get match IDs and their deliveries for average metrics calculation
     match_ids = get_matches_for_batter_and_filters(df, selected_batter, filters)
+    all_matches_df = get_matches_df(df, match_ids)
     
     # Get batter hand for display
     batter_hand = get_batter_hand(df, selected_batter)
@@ -134,53 +116,15 @@ def render_innings_progression_page(df):
     progression_df = calculate_progression_data(filtered_df, selected_batter, filters, rolling_min, rolling_max)
     
     if progression_df is not None and len(progression_df) > 0:
-        # Create 2x2 grid of plots
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig_sr = create_progression_plot(
-                progression_df, 'SR', 
-                'Strike Rate per Rolling Window', 
-                'Strike Rate Progression',
-                color="#4ade80"
-            )
-            st.plotly_chart(fig_sr, use_container_width=True, config={'displayModeBar': False})
-        
-        with col2:
-            fig_boundary = create_progression_plot(
-                progression_df, 'Boundary %', 
-                'Boundary % per Rolling Window', 
-                'Boundary % Progression',
-                color="#60a5fa"
-            )
-            st.plotly_chart(fig_boundary, use_container_width=True, config={'displayModeBar': False})
-        
-        col3, col4 = st.columns(2)
-        
-        with col3:
-            fig_dot = create_progression_plot(
-                progression_df, 'Dot %', 
-                'Dot Balls % per Rolling Window', 
-                'Dot Balls % Progression',
-                color="#f87171"
-            )
-            st.plotly_chart(fig_dot, use_container_width=True, config={'displayModeBar': False})
-        
-        with col4:
-            fig_aerial = create_progression_plot(
-                progression_df, 'Aerial %', 
-                'Aerial Shots % per Rolling Window', 
-                'Aerial Shots % Progression',
-                color="#fbbf24"
-            )
-            st.plotly_chart(fig_aerial, use_container_width=True, config={'displayModeBar': False})
+        # Single 2x2 figure: one chart payload instead of four
+        fig = create_progression_plot(progression_df)
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
     else:
         st.info("No progression data available for the selected rolling window.")
     
     st.markdown("---")
     
     # Section 2: Over-by-over progression table
-    all_matches_df = df[df['fixtureId'].isin(match_ids)]
     over_stats = calculate_stats_by_group(filtered_df, all_matches_df, match_ids, 'over')
     
     if len(over_stats) > 0:
@@ -1,3 +1,4 @@
+import streamlit as st
 import pandas as pd
 import numpy as np
 
@@ -312,16 +313,20 @@ def calculate_dismissal_by_group(df, group_column, include_runout=True):
     
     return pd.DataFrame(results)
 
-def calculate_progression_data(df, batter, filters, rolling_min, rolling_max):
+@st.cache_data(max_entries=64)
+def calculate_progression_data(_df, batter, filters, rolling_min, rolling_max):
     """
     Calculate progression data for innings progression plots.
     Returns data for Strike Rate, Boundary %, Dot %, Aerial % per rolling window.
+    
+    _df is not hashed: it must be the batter's filtered data, so the cache is
+    keyed on batter, filters and the rolling window.
     """
-    if df is None or len(df) == 0:
+    if _df is None or len(_df) == 0:
         return None
     
     # Need to calculate ball number within each innings for the batter
-    batter_df = df.copy()
+    batter_df = _df.copy()
     
     # Sort by fixture and timestamp to get ball order
     if 'timestamp' in batter_df.columns:
@@ -82,6 +82,12 @@ def get_unique_values(_df, column):
         return []
     return sorted(_df[column].dropna().unique().tolist())
 
+def get_matches_df(df, match_ids):
+    """Get all deliveries from the given matches"""
+    if df is None:
+        return None
+    return df[df['fixtureId'].isin(match_ids)]
+
 def get_batter_hand(df, batter):
     """Get the handedness of a batter"""
     if df is None or batter is None: